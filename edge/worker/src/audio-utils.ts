@@ -38,22 +38,30 @@ export function concatUint8Arrays(chunks: Uint8Array[]): Uint8Array {
   return merged;
 }
 
-export function pcm16ToWavBytes(
-  pcm: Uint8Array,
-  sampleRate = TARGET_SAMPLE_RATE,
-  channels = TARGET_CHANNELS
-): Uint8Array {
-  const header = new Uint8Array(44);
-  const view = new DataView(header.buffer);
+// RIFF/WAVE chunk tags at their fixed header offsets. pcm_s16le is already the
+// target sample format, so wrapping it as WAV is just these sentinels plus the
+// size/format fields — no encoder or intermediate buffers needed.
+const WAV_HEADER_BYTES = 44;
+const WAV_HEADER_TAGS: ReadonlyArray<readonly [number, Uint8Array]> = [
+  [0, Uint8Array.of(0x52, 0x49, 0x46, 0x46)], // "RIFF"
+  [8, Uint8Array.of(0x57, 0x41, 0x56, 0x45)], // "WAVE"
+  [12, Uint8Array.of(0x66, 0x6d, 0x74, 0x20)], // "fmt "
+  [36, Uint8Array.of(0x64, 0x61, 0x74, 0x61)], // "data"
+];
+
+function writeWavHeader(
+  out: Uint8Array,
+  pcmByteLength: number,
+  sampleRate: number,
+  channels: number
+): void {
+  const view = new DataView(out.buffer, out.byteOffset, WAV_HEADER_BYTES);
   const bitsPerSample = 16;
   const byteRate = sampleRate * channels * (bitsPerSample / 8);
   const blockAlign = channels * (bitsPerSample / 8);
 
-  const encoder = new TextEncoder();
-  header.set(encoder.encode("RIFF"), 0);
-  view.setUint32(4, 36 + pcm.byteLength, true);
-  header.set(encoder.encode("WAVE"), 8);
-  header.set(encoder.encode("fmt "), 12);
+  for (const [offset, tag] of WAV_HEADER_TAGS) out.set(tag, offset);
+  view.setUint32(4, 36 + pcmByteLength, true);
   view.setUint32(16, 16, true);
   view.setUint16(20, 1, true);
   view.setUint16(22, channels, true);
@@ -61,10 +69,40 @@ export function pcm16ToWavBytes(
   view.setUint32(28, byteRate, true);
   view.setUint16(32, blockAlign, true);
   view.setUint16(34, bitsPerSample, true);
-  header.set(encoder.encode("data"), 36);
-  view.setUint32(40, pcm.byteLength, true);
+  view.setUint32(40, pcmByteLength, true);
+}
 
-  return concatUint8Arrays([header, pcm]);
+export function pcm16ToWavBytes(
+  pcm: Uint8Array,
+  sampleRate = TARGET_SAMPLE_RATE,
+  channels = TARGET_CHANNELS
+): Uint8Array {
+  // Single allocation: header written in place, PCM copied once behind it.
+  const wav = new Uint8Array(WAV_HEADER_BYTES + pcm.byteLength);
+  writeWavHeader(wav, pcm.byteLength, sampleRate, channels);
+  wav.set(pcm, WAV_HEADER_BYTES);
+  return wav;
+}
+
+/**
+ * Wrap PCM split across several chunks (e.g. per-second R2 objects) as WAV,
+ * copying each chunk straight behind the header instead of concatenating first.
+ */
+export function pcm16PartsToWavBytes(
+  parts: readonly Uint8Array[],
+  sampleRate = TARGET_SAMPLE_RATE,
+  channels = TARGET_CHANNELS
+): Uint8Array {
+  let pcmByteLength = 0;
+  for (const part of parts) pcmByteLength += part.byteLength;
+  const wav = new Uint8Array(WAV_HEADER_BYTES + pcmByteLength);
+  writeWavHeader(wav, pcmByteLength, sampleRate, channels);
+  let offset = WAV_HEADER_BYTES;
+  for (const part of parts) {
+    wav.set(part, offset);
+    offset += part.byteLength;
+  }
+  return wav;
 }
 
 export function truncatePcm16WavToSeconds(
@@ -74,11 +112,11 @@ export function truncatePcm16WavToSeconds(
   channels = TARGET_CHANNELS
 ): Uint8Array {
   const maxPcmBytes = Math.max(0, Math.floor(maxSeconds * sampleRate * channels * 2));
-  if (maxPcmBytes <= 0 || wavBytes.byteLength <= 44) {
+  if (maxPcmBytes <= 0 || wavBytes.byteLength <= WAV_HEADER_BYTES) {
     return wavBytes;
   }
 
-  const pcm = wavBytes.subarray(44);
+  const pcm = wavBytes.subarray(WAV_HEADER_BYTES);
   if (pcm.byteLength <= maxPcmBytes) {
     return wavBytes;
   }
@@ -122,8 +160,12 @@ function crc32(bytes: Uint8Array): number {
   return (crc ^ 0xffffffff) >>> 0;
 }
 
+// TextEncoder is stateless; one long-lived instance serves every call instead of
+// constructing a fresh encoder per ZIP entry / DOCX part.
+const UTF8_ENCODER = new TextEncoder();
+
 export function encodeUtf8(input: string): Uint8Array {
-  return new TextEncoder().encode(input);
+  return UTF8_ENCODER.encode(input);
 }
 
 export function makeZipStored(files: Array<{ name: string; data: Uint8Array }>): Uint8Array {
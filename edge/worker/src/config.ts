@@ -1112,9 +1112,16 @@ export function getErrorMessage(err: unknown): string {
   return String(err);
 }
 
-/** Calculate total transcript duration from the last utterance's end_ms. */
+/**
+ * Calculate total transcript duration from the last utterance's end_ms.
+ * Single pass with no intermediate array or argument spread (which also caps
+ * out on very long transcripts).
+ */
 export function calcTranscriptDurationMs(transcript: Array<{ end_ms: number }>): number {
-  return transcript.length > 0 ? Math.max(...transcript.map(u => u.end_ms)) : 0;
+  if (transcript.length === 0) return 0;
+  let maxEndMs = -Infinity;
+  for (const u of transcript) maxEndMs = Math.max(maxEndMs, u.end_ms);
+  return maxEndMs;
 }
 
 export function jsonResponse(payload: unknown, status = 200, headers?: HeadersInit): Response {
@@ -1386,41 +1393,51 @@ export function extractNumberByKeys(value: unknown, keys: string[]): number | nu
   return null;
 }
 
+// Self-introduction name extraction tables, built once at module load.
+// Patterns are tried in priority order (an explicit "my name is" beats a
+// leftmost "i am"), so they stay separate rather than one alternation.
+const NAME_STOPWORDS: ReadonlySet<string> = new Set([
+  "the",
+  "and",
+  "with",
+  "from",
+  "about",
+  "which",
+  "where",
+  "when",
+  "doing",
+  "really",
+  "excited",
+  "levels",
+  "going",
+  "american",
+  "school",
+  "studying",
+  "netherlands"
+]);
+const NAME_INTRO_PATTERNS: readonly RegExp[] = [
+  /\bmy name is\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
+  /\bi am\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
+  /\bi'm\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
+  /\b(?:usually\s+)?go(?:es)?\s+by\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
+  /\b(?:(?:you\s+)?can\s+)?call me\s+([A-Za-z][A-Za-z .'-]{0,60})/i
+];
+const NAME_TOKEN_PATTERN = /^[A-Za-z][A-Za-z'-]{0,30}$/;
+// Every NAME_INTRO_PATTERNS match contains one of these literals, so utterances
+// without any of them (the vast majority) skip the regex scans entirely.
+const NAME_INTRO_NEEDLES: readonly string[] = ["my name is", "i am", "i'm", "by", "call me"];
+
 export function extractNameFromText(text: string): string | null {
-  const stopwords = new Set([
-    "the",
-    "and",
-    "with",
-    "from",
-    "about",
-    "which",
-    "where",
-    "when",
-    "doing",
-    "really",
-    "excited",
-    "levels",
-    "going",
-    "american",
-    "school",
-    "studying",
-    "netherlands"
-  ]);
-  const patterns = [
-    /\bmy name is\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
-    /\bi am\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
-    /\bi'm\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
-    /\b(?:usually\s+)?go(?:es)?\s+by\s+([A-Za-z][A-Za-z .'-]{0,60})/i,
-    /\b(?:(?:you\s+)?can\s+)?call me\s+([A-Za-z][A-Za-z .'-]{0,60})/i
-  ];
-  for (const pattern of patterns) {
+  const lowered = text.toLowerCase();
+  if (!NAME_INTRO_NEEDLES.some((needle) => lowered.includes(needle))) return null;
+  for (const pattern of NAME_INTRO_PATTERNS) {
     const match = text.match(pattern);
     if (!match || !match[1]) continue;
     const cleaned = match[1].trim().replace(/\s+/g, " ").replace(/[.,;:!?]+$/, "");
     const tokens = cleaned.split(/\s+/).filter(Boolean);
     if (tokens.length === 0 || tokens.length > 3) continue;
-    if (tokens.some((token) => !/^[A-Za-z][A-Za-z'-]{0,30}$/.test(token))) continue;
-    if (tokens.some((token) => stopwords.has(token.toLowerCase()))) continue;
+    if (tokens.some((token) => !NAME_TOKEN_PATTERN.test(token))) continue;
+    if (tokens.some((token) => NAME_STOPWORDS.has(token.toLowerCase()))) continue;
     if (cleaned.length >= 2 && cleaned.length <= 64) {
       return cleaned;
     }
@@ -36,6 +36,8 @@ const DEFAULT_MEMORY_LIMIT = 2 * 1024 * 1024;
 export class EmbeddingCache {
   private readonly entries: Map<string, CachedEmbedding> = new Map();
   private readonly memoryLimitBytes: number;
+  /** Sorted snapshot shared by all readers; dropped whenever entries change. */
+  private sortedSnapshot: readonly CachedEmbedding[] | null = null;
 
   constructor(memoryLimitBytes: number = DEFAULT_MEMORY_LIMIT) {
     this.memoryLimitBytes = memoryLimitBytes;
@@ -48,6 +50,7 @@ export class EmbeddingCache {
       return false;
     }
     this.entries.set(entry.segment_id, entry);
+    this.sortedSnapshot = null;
     return true;
   }
 
@@ -56,9 +59,16 @@ export class EmbeddingCache {
     return this.entries.get(segmentId);
   }
 
-  /** Get all cached embeddings, ordered by start_ms. */
-  getAllEmbeddings(): CachedEmbedding[] {
-    return [...this.entries.values()].sort((a, b) => a.start_ms - b.start_ms);
+  /**
+   * Get all cached embeddings, ordered by start_ms.
+   * The sorted list is built once per mutation and shared between callers
+   * (clustering, serialization, role filters), so it is returned read-only.
+   */
+  getAllEmbeddings(): readonly CachedEmbedding[] {
+    if (!this.sortedSnapshot) {
+      this.sortedSnapshot = [...this.entries.values()].sort((a, b) => a.start_ms - b.start_ms);
+    }
+    return this.sortedSnapshot;
   }
 
   /** Get embeddings filtered by stream role. */
@@ -79,6 +89,7 @@ export class EmbeddingCache {
   /** Clear all cached embeddings. */
   clear(): void {
     this.entries.clear();
+    this.sortedSnapshot = null;
   }
 
   /**
@@ -102,6 +113,7 @@ export class EmbeddingCache {
    */
   deserialize(data: CachedEmbeddingSerialized[]): void {
     this.entries.clear();
+    this.sortedSnapshot = null;
     for (const item of data) {
       this.entries.set(item.segment_id, {
         segment_id: item.segment_id,
@@ -61,19 +61,23 @@ export function refreshEnrollmentMode(state: SessionState, nowIso: string): void
 
 // ── Roster name matching ────────────────────────────────────────────
 
+function normalizeRosterKey(value: string): string {
+  return value.trim().toLowerCase().replace(/[^a-z0-9]+/g, "");
+}
+
 export function rosterNameByCandidate(
   state: SessionState,
   candidate: string | null
 ): string | null {
   if (!candidate) return null;
-  const normalized = candidate.trim().toLowerCase().replace(/[^a-z0-9]+/g, "");
+  const normalized = normalizeRosterKey(candidate);
   if (!normalized) return null;
   const roster = state.roster ?? [];
   let fuzzySubstring: string | null = null;
   let fuzzyEdit: string | null = null;
   let bestEditDist = Infinity;
   for (const item of roster) {
-    const rosterNorm = item.name.trim().toLowerCase().replace(/[^a-z0-9]+/g, "");
+    const rosterNorm = normalizeRosterKey(item.name);
     if (!rosterNorm) continue;
     // 1. Exact match — return immediately.
     if (rosterNorm === normalized) {
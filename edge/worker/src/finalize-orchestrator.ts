@@ -42,6 +42,7 @@ import { globalCluster, mapClustersToRoster } from "./global-cluster";
 import type { CachedEmbedding, GlobalClusterResult, CaptionEvent } from "./providers/types";
 import type { RosterParticipant } from "./global-cluster";
 import { EmbeddingCache } from "./embedding-cache";
+import { ALLOWED_MEMO_TYPES } from "./memos";
 import { LocalWhisperASRProvider } from "./providers/asr-local-whisper";
 import { ACSCaptionASRProvider } from "./providers/asr-acs-caption";
 import { ACSCaptionDiarizationProvider } from "./providers/diarization-acs-caption";
@@ -88,6 +89,7 @@ import type {
   InferenceRegenerateClaimResponse,
   FeedbackCache,
   CaptureState,
+  ParticipantProfile,
 } from "./config";
 import type { Env } from "./config";
 import type { DependencyHealthSnapshot } from "./inference_client";
@@ -387,7 +389,7 @@ export async function runFinalizeV2Job(
               memo_id: memoId,
               created_at_ms: typeof raw.created_at_ms === "number" ? raw.created_at_ms : Date.now(),
               author_role: "teacher",
-              type: (["observation", "evidence", "question", "decision", "score"].includes(raw.type as string) ? raw.type : "observation") as MemoItem["type"],
+              type: (ALLOWED_MEMO_TYPES.has(raw.type as string) ? raw.type : "observation") as MemoItem["type"],
               tags: Array.isArray(raw.tags) ? raw.tags.filter((t): t is string => typeof t === "string") : [],
               text: typeof raw.text === "string" ? raw.text : "",
               stage: typeof raw.stage === "string" ? raw.stage : undefined,
@@ -899,7 +901,7 @@ export async function runFinalizeV2Job(
           memo_id: memoId,
           created_at_ms: typeof raw.created_at_ms === "number" ? raw.created_at_ms : Date.now(),
           author_role: "teacher",
-          type: (["observation", "evidence", "question", "decision", "score"].includes(raw.type as string) ? raw.type : "observation") as MemoItem["type"],
+          type: (ALLOWED_MEMO_TYPES.has(raw.type as string) ? raw.type : "observation") as MemoItem["type"],
           tags: Array.isArray(raw.tags) ? raw.tags.filter((t): t is string => typeof t === "string") : [],
           text: typeof raw.text === "string" ? raw.text : "",
           stage: typeof raw.stage === "string" ? raw.stage : undefined,
@@ -956,11 +958,14 @@ export async function runFinalizeV2Job(
               min_cluster_size: 1
             });
 
-            // Build roster participants with enrollment embeddings for mapping
+            // Build roster participants with enrollment embeddings for mapping.
+            // Index profiles by name once (first profile wins, as with .find).
+            const profileByName = new Map<string, ParticipantProfile>();
+            for (const p of preState.participant_profiles ?? []) {
+              if (!profileByName.has(p.name)) profileByName.set(p.name, p);
+            }
             const rosterParticipants: RosterParticipant[] = (preState.roster ?? []).map((r) => {
-              const profile = (preState.participant_profiles ?? []).find(
-                (p) => p.name === r.name
-              );
+              const profile = profileByName.get(r.name);
               return {
                 name: r.name,
                 enrollment_embedding: profile?.centroid?.length
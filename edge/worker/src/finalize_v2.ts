@@ -1237,12 +1237,22 @@ export function buildMemoFirstReport(options: {
         }
       ];
 
+  // Attribute each memo once up front (order preserved) instead of
+  // re-inferring every memo's speaker for every person.
+  const memosBySpeaker = new Map<string, Array<MemoItem & { evidence_ids?: string[] }>>();
+  for (const memo of options.memos) {
+    const key = inferMemoSpeakerKey(memo, evidenceById);
+    const bucket = memosBySpeaker.get(key);
+    if (bucket) bucket.push(memo);
+    else memosBySpeaker.set(key, [memo]);
+  }
+
   const perPerson: PersonFeedbackItem[] = [];
 
   for (const stat of people) {
     const personKey = stat.speaker_name ?? stat.speaker_key;
     const fallbackBySpeaker = evidenceBySpeaker.get(personKey) ?? [];
-    const memoRows = options.memos.filter((memo) => inferMemoSpeakerKey(memo, evidenceById) === personKey);
+    const memoRows = memosBySpeaker.get(personKey) ?? [];
     const dimensions: DimensionFeedback[] = DIMENSIONS.map((dimension) => ({
       dimension,
       score: 5,
@@ -35,18 +35,66 @@ export function cosineSimilarity(a: Float32Array, b: Float32Array): number {
   return dot / denom;
 }
 
+/**
+ * Return a unit-length copy of a vector (all zeros if its norm is zero).
+ * Normalizing once up front turns every later cosine into a plain dot product.
+ */
+export function l2Normalize(v: Float32Array): Float32Array {
+  let norm = 0;
+  for (let i = 0; i < v.length; i++) norm += v[i] * v[i];
+  const out = new Float32Array(v.length);
+  if (norm === 0) return out;
+  const inv = 1 / Math.sqrt(norm);
+  for (let i = 0; i < v.length; i++) out[i] = v[i] * inv;
+  return out;
+}
+
+/**
+ * Dot product of two vectors. Matches cosineSimilarity() when both inputs are
+ * L2-normalized, including returning 0 for empty or mismatched lengths.
+ */
+export function dotProduct(a: Float32Array, b: Float32Array): number {
+  if (a.length !== b.length || a.length === 0) return 0;
+  let dot = 0;
+  for (let i = 0; i < a.length; i++) dot += a[i] * b[i];
+  return dot;
+}
+
 /**
  * Compute a symmetric pairwise cosine distance matrix.
  * Distance = 1 - cosine_similarity, clamped to [0, 2].
  *
+ * Each embedding is L2-normalized once up front, so the O(n^2) pair loop is a
+ * single dot product per pair instead of recomputing both norms every time.
+ *
  * Returns a flat Float32Array of size n*n (row-major).
  */
-export function computeDistanceMatrix(embeddings: Float32Array[]): Float32Array {
+export function computeDistanceMatrix(embeddings: readonly Float32Array[]): Float32Array {
   const n = embeddings.length;
   const dist = new Float32Array(n * n);
+  const packed = packUnitRows(embeddings);
+  if (packed) {
+    // Fast path: all rows share one dimension and live in one contiguous buffer
+    const { rows, dim } = packed;
+    for (let i = 0; i < n; i++) {
+      const rowI = i * dim;
+      for (let j = i + 1; j < n; j++) {
+        const rowJ = j * dim;
+        let dot = 0;
+        for (let k = 0; k < dim; k++) dot += rows[rowI + k] * rows[rowJ + k];
+        const d = Math.max(0, 1 - dot);
+        dist[i * n + j] = d;
+        dist[j * n + i] = d;
+      }
+    }
+    return dist;
+  }
+
+  // Mixed dimensions: mismatched pairs score 0 similarity, as in cosineSimilarity
+  const unit = embeddings.map(l2Normalize);
   for (let i = 0; i < n; i++) {
     for (let j = i + 1; j < n; j++) {
-      const d = Math.max(0, 1 - cosineSimilarity(embeddings[i], embeddings[j]));
+      const d = Math.max(0, 1 - dotProduct(unit[i], unit[j]));
       dist[i * n + j] = d;
       dist[j * n + i] = d;
     }
@@ -55,6 +103,33 @@ export function computeDistanceMatrix(embeddings: Float32Array[]): Float32Array
   return dist;
 }
 
+/**
+ * Pack L2-normalized copies of equal-length vectors into one row-major
+ * Float32Array (n*dim), so pairwise loops stream a single buffer instead of
+ * chasing n separate arrays. Returns null for empty input or mixed dimensions.
+ */
+export function packUnitRows(
+  vectors: readonly Float32Array[]
+): { rows: Float32Array; dim: number } | null {
+  if (vectors.length === 0) return null;
+  const dim = vectors[0].length;
+  if (dim === 0) return null;
+  for (const v of vectors) {
+    if (v.length !== dim) return null;
+  }
+  const rows = new Float32Array(vectors.length * dim);
+  for (let i = 0; i < vectors.length; i++) {
+    const v = vectors[i];
+    const base = i * dim;
+    let norm = 0;
+    for (let k = 0; k < dim; k++) norm += v[k] * v[k];
+    if (norm === 0) continue; // zero vector stays zero
+    const inv = 1 / Math.sqrt(norm);
+    for (let k = 0; k < dim; k++) rows[base + k] = v[k] * inv;
+  }
+  return { rows, dim };
+}
+
 // ── Agglomerative clustering ─────────────────────────────────────────────────
 
 /**
@@ -194,7 +269,7 @@ const DEFAULT_CLUSTER_OPTIONS: ClusterOptions = {
  * Returns cluster assignments and centroid embeddings for roster mapping.
  */
 export function globalCluster(
-  embeddings: CachedEmbedding[],
+  embeddings: readonly CachedEmbedding[],
   options?: Partial<ClusterOptions>
 ): GlobalClusterResult {
   const opts = { ...DEFAULT_CLUSTER_OPTIONS, ...options };
@@ -226,26 +301,28 @@ export function globalCluster(
 
   // Step 3: Group by label and compute centroids
   const clusterMap = new Map<number, number[]>(); // label -> indices
+  const earliestStart = new Map<number, number>(); // label -> min start_ms
   for (let i = 0; i < labels.length; i++) {
     const label = labels[i];
     if (!clusterMap.has(label)) clusterMap.set(label, []);
     clusterMap.get(label)!.push(i);
+    const start = embeddings[i].start_ms;
+    const prev = earliestStart.get(label);
+    if (prev === undefined || start < prev) earliestStart.set(label, start);
   }
 
   const clusters = new Map<string, string[]>();
   const centroids = new Map<string, Float32Array>();
 
-  // Sort clusters by earliest segment for stable ordering
+  // Sort clusters by earliest segment for stable ordering (spk_N ids follow this order)
   const sortedLabels = [...clusterMap.entries()]
-    .sort((a, b) => {
-      const aMin = Math.min(...a[1].map((i) => embeddings[i].start_ms));
-      const bMin = Math.min(...b[1].map((i) => embeddings[i].start_ms));
-      return aMin - bMin;
-    });
+    .sort((a, b) => earliestStart.get(a[0])! - earliestStart.get(b[0])!);
 
   let spkIdx = 0;
+  const keptIndices: number[][] = [];
   for (const [, indices] of sortedLabels) {
     if (indices.length < opts.min_cluster_size) continue;
+    keptIndices.push(indices);
 
     const spkId = `spk_${spkIdx}`;
     clusters.set(spkId, indices.map((i) => embeddings[i].segment_id));
@@ -268,28 +345,30 @@ export function globalCluster(
   }
 
   // Confidence: average intra-cluster similarity (higher = better separation)
-  const confidence = computeClusteringConfidence(clusters, embeddings);
+  const confidence = computeClusteringConfidence(keptIndices, distMatrix, embeddings.length);
 
   return { clusters, centroids, confidence };
 }
 
-/** Compute an overall clustering confidence score based on intra-cluster cohesion. */
+/**
+ * Compute an overall clustering confidence score based on intra-cluster cohesion.
+ * Reads pair similarities back out of the distance matrix (similarity =
+ * 1 - distance) rather than recomputing cosine for every member pair.
+ */
 function computeClusteringConfidence(
-  clusters: Map<string, string[]>,
-  embeddings: CachedEmbedding[]
+  clusterIndices: number[][],
+  distMatrix: Float32Array,
+  n: number
 ): number {
-  const idxMap = new Map(embeddings.map((e, i) => [e.segment_id, i]));
   let totalSim = 0;
   let totalPairs = 0;
 
-  for (const [, segmentIds] of clusters) {
-    if (segmentIds.length < 2) continue;
-    for (let i = 0; i < segmentIds.length; i++) {
-      for (let j = i + 1; j < segmentIds.length; j++) {
-        const ai = idxMap.get(segmentIds[i]);
-        const bi = idxMap.get(segmentIds[j]);
-        if (ai === undefined || bi === undefined) continue;
-        totalSim += cosineSimilarity(embeddings[ai].embedding, embeddings[bi].embedding);
+  for (const indices of clusterIndices) {
+    if (indices.length < 2) continue;
+    for (let i = 0; i < indices.length; i++) {
+      const row = indices[i] * n;
+      for (let j = i + 1; j < indices.length; j++) {
+        totalSim += 1 - distMatrix[row + indices[j]];
         totalPairs++;
       }
     }
@@ -324,13 +403,23 @@ export function mapClustersToRoster(
 ): Map<string, string> {
   const mapping = new Map<string, string>();
 
-  // Build candidate scores: [spk_id, participant_name, similarity]
+  // Normalize each enrollment embedding once rather than once per centroid
+  const enrolled: Array<[string, Float32Array]> = [];
+  for (const participant of roster) {
+    if (!participant.enrollment_embedding) continue;
+    enrolled.push([participant.name, l2Normalize(participant.enrollment_embedding)]);
+  }
+
+  // Build candidate scores: [spk_id, participant_name, similarity]. Pairs below
+  // the threshold can never be assigned, so they are dropped before the sort.
   const candidates: Array<[string, string, number]> = [];
-  for (const [spkId, centroid] of result.centroids) {
-    for (const participant of roster) {
-      if (!participant.enrollment_embedding) continue;
-      const sim = cosineSimilarity(centroid, participant.enrollment_embedding);
-      candidates.push([spkId, participant.name, sim]);
+  if (enrolled.length > 0) {
+    for (const [spkId, centroid] of result.centroids) {
+      const unitCentroid = l2Normalize(centroid);
+      for (const [name, unitEnrollment] of enrolled) {
+        const sim = dotProduct(unitCentroid, unitEnrollment);
+        if (sim >= similarityThreshold) candidates.push([spkId, name, sim]);
+      }
     }
   }
 
@@ -340,8 +429,7 @@ export function mapClustersToRoster(
   const assignedSpeakers = new Set<string>();
   const assignedNames = new Set<string>();
 
-  for (const [spkId, name, sim] of candidates) {
-    if (sim < similarityThreshold) continue;
+  for (const [spkId, name] of candidates) {
     if (assignedSpeakers.has(spkId) || assignedNames.has(name)) continue;
     mapping.set(spkId, name);
     assignedSpeakers.add(spkId);
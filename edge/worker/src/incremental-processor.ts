@@ -8,7 +8,7 @@
  * Pattern: standalone async functions with explicit context rather than `this`.
  */
 
-import { concatUint8Arrays, pcm16ToWavBytes, bytesToBase64, TARGET_SAMPLE_RATE, TARGET_CHANNELS } from "./audio-utils";
+import { pcm16PartsToWavBytes, bytesToBase64, TARGET_SAMPLE_RATE, TARGET_CHANNELS } from "./audio-utils";
 import { chunkObjectKey } from "./config";
 import { log, getErrorMessage, normalizeSessionState, getSessionLocale, STORAGE_KEY_STATE, STORAGE_KEY_INCREMENTAL_UTTERANCES, STORAGE_KEY_INCREMENTAL_SPEAKER_PROFILES, STORAGE_KEY_INCREMENTAL_CHECKPOINT, MAX_STORED_UTTERANCES } from "./config";
 import type { Env } from "./config";
@@ -117,8 +117,7 @@ export async function runIncrementalJob(sessionId: string, ctx: IncrementalConte
       }
     }
 
-    const fullPcm = concatUint8Arrays(pcmParts);
-    const wavBytes = pcm16ToWavBytes(fullPcm, TARGET_SAMPLE_RATE, TARGET_CHANNELS);
+    const wavBytes = pcm16PartsToWavBytes(pcmParts, TARGET_SAMPLE_RATE, TARGET_CHANNELS);
     const audioB64 = bytesToBase64(wavBytes);
 
     const state = normalizeSessionState(await storage.get(STORAGE_KEY_STATE));
@@ -186,13 +185,17 @@ export async function runIncrementalJob(sessionId: string, ctx: IncrementalConte
       stream_role: u.stream_role ?? "mixed",
     }));
 
+    // Append-only merge: stored utterances are already in increment order, so new
+    // ones are appended (no re-sort) and each dedup key is built exactly once.
     const dedupKey = (u: StoredUtterance) => `${u.increment_index}:${u.utterance_id}`;
-    const seen = new Set(existingUtts.map(dedupKey));
+    const seen = new Set<string>();
+    for (const u of existingUtts) seen.add(dedupKey(u));
     const merged = [...existingUtts];
     for (const u of newUtts) {
-      if (!seen.has(dedupKey(u))) {
+      const key = dedupKey(u);
+      if (!seen.has(key)) {
         merged.push(u);
-        seen.add(dedupKey(u));
+        seen.add(key);
       }
     }
     const trimmed = merged.length > MAX_STORED_UTTERANCES
@@ -351,11 +354,12 @@ export async function runIncrementalFinalize(
 
       if (fetchFailed || pcmChunks.length === 0) continue;
 
-      const totalPcm = concatUint8Arrays(pcmChunks);
-      const segPayload = Math.ceil(totalPcm.byteLength * BASE64_OVERHEAD) + JSON_FIELD_OVERHEAD;
+      let pcmByteLength = 0;
+      for (const chunk of pcmChunks) pcmByteLength += chunk.byteLength;
+      const segPayload = Math.ceil(pcmByteLength * BASE64_OVERHEAD) + JSON_FIELD_OVERHEAD;
       if (estimatedPayloadBytes + segPayload > RECOMPUTE_MAX_PAYLOAD_BYTES) continue;
 
-      const wavBytes = pcm16ToWavBytes(totalPcm);
+      const wavBytes = pcm16PartsToWavBytes(pcmChunks);
       const audioB64 = bytesToBase64(wavBytes);
 
       recomputeSegments.push({
@@ -19,8 +19,7 @@ import {
 import {
   decodeBase64ToBytes,
   bytesToBase64,
-  concatUint8Arrays,
-  pcm16ToWavBytes,
+  pcm16PartsToWavBytes,
   buildDocxBytesFromText,
   TARGET_SAMPLE_RATE,
   TARGET_CHANNELS,
@@ -728,8 +727,7 @@ export class MeetingSessionDO extends DurableObject<Env> {
         const chunks = await this.loadChunkRange(sessionId, streamRole, startSeq, endSeq);
         if (chunks.length === 0) { skipped++; continue; }
 
-        const pcmData = concatUint8Arrays(chunks);
-        const wavBytes = pcm16ToWavBytes(pcmData, TARGET_SAMPLE_RATE, TARGET_CHANNELS);
+        const wavBytes = pcm16PartsToWavBytes(chunks, TARGET_SAMPLE_RATE, TARGET_CHANNELS);
         const audioPayload: AudioPayload = {
           content_b64: bytesToBase64(wavBytes),
           format: "wav",
@@ -1368,11 +1366,14 @@ export class MeetingSessionDO extends DurableObject<Env> {
     if (latestUtteranceEndMs - lastCheckpointAt < intervalMs) return;
 
     try {
-      const checkpoints = await this.loadCheckpoints();
+      // Checkpoints and utterances are independent storage reads — issue together
+      const [checkpoints, utterancesByStream] = await Promise.all([
+        this.loadCheckpoints(),
+        this.loadUtterancesRawByStream(),
+      ]);
       const checkpointIndex = checkpoints.length;
 
       // Gather recent utterances (since last checkpoint)
-      const utterancesByStream = await this.loadUtterancesRawByStream();
       const allUtterances = [
         ...utterancesByStream.teacher,
         ...utterancesByStream.students,
@@ -1384,7 +1385,7 @@ export class MeetingSessionDO extends DurableObject<Env> {
 
       if (recentUtterances.length === 0) return;
 
-      // Gather recent memos
+      // Gather recent memos (read only once there is something to checkpoint)
       const memos = (await this.ctx.storage.get<MemoItem[]>(STORAGE_KEY_MEMOS)) ?? [];
       const recentMemos = memos.filter(
         (m) => m.created_at_ms > lastCheckpointAt
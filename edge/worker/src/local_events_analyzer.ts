@@ -64,13 +64,30 @@ function quote(text: string, limit = 160): string {
   return `${normalized.slice(0, Math.max(0, limit - 1)).trimEnd()}…`;
 }
 
-function containsCue(text: string, cues: string[]): boolean {
-  const lowered = text.toLowerCase();
-  return cues.some((cue) => lowered.includes(cue));
+// Each cue list is compiled into one alternation so an utterance is scanned once
+// per category rather than once per cue. Cues are lowercase literals; callers
+// match against the lowercased text.
+function cuePattern(cues: readonly string[]): RegExp {
+  return new RegExp(cues.map((cue) => cue.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")).join("|"));
 }
 
-function sortTranscript(items: TranscriptUtterance[]): TranscriptUtterance[] {
-  return [...items].sort((a, b) => a.start_ms - b.start_ms || a.end_ms - b.end_ms);
+const SUPPORT_CUES = cuePattern(["i agree", "based on", "to add", "building on", "补充", "我同意", "支持"]);
+const SUMMARY_CUES = cuePattern(["let me summarize", "in summary", "to summarize", "总结一下", "小结"]);
+const DECISION_CUES = cuePattern(["we decide", "decision", "next step", "conclusion", "决定", "结论", "下一步"]);
+
+function compareUtterances(a: TranscriptUtterance, b: TranscriptUtterance): number {
+  return a.start_ms - b.start_ms || a.end_ms - b.end_ms;
+}
+
+// Finalized transcripts almost always arrive in time order already; a linear
+// check avoids copying and sorting them. The input is never mutated either way.
+function sortTranscript(items: TranscriptUtterance[]): readonly TranscriptUtterance[] {
+  for (let i = 1; i < items.length; i += 1) {
+    if (compareUtterances(items[i - 1], items[i]) > 0) {
+      return [...items].sort(compareUtterances);
+    }
+  }
+  return items;
 }
 
 export function analyzeEventsLocally(params: {
@@ -79,13 +96,17 @@ export function analyzeEventsLocally(params: {
   memos: MemoForAnalysis[];
   stats: SpeakerStatForAnalysis[];
 }): LocalAnalysisEvent[] {
-  const supportCues = ["i agree", "based on", "to add", "building on", "补充", "我同意", "支持"];
-  const summaryCues = ["let me summarize", "in summary", "to summarize", "总结一下", "小结"];
-  const decisionCues = ["we decide", "decision", "next step", "conclusion", "决定", "结论", "下一步"];
+  if (params.transcript.length === 0 && params.stats.length === 0 && params.memos.length === 0) {
+    return [];
+  }
 
   const items = sortTranscript(params.transcript);
+  // Resolved once per utterance; the loop compares each item with its predecessor.
+  const keys = items.map(speakerKey);
   const events: LocalAnalysisEvent[] = [];
+  const eventIdPrefix = `ev_${params.sessionId}_`;
   let seq = 1;
+  const nextEventId = (): string => eventIdPrefix + String(seq++).padStart(4, "0");
 
   const pushEvent = (
     eventType: AnalysisEventType,
@@ -101,7 +122,7 @@ export function analyzeEventsLocally(params: {
     }
   ) => {
     events.push({
-      event_id: `ev_${params.sessionId}_${String(seq).padStart(4, "0")}`,
+      event_id: nextEventId(),
       event_type: eventType,
       actor: options?.actor ?? speakerKey(item),
       target: options?.target ?? null,
@@ -111,56 +132,60 @@ export function analyzeEventsLocally(params: {
       confidence: Math.max(0, Math.min(1, options?.confidence ?? 0.7)),
       rationale: options?.rationale ?? "local events analyzer"
     });
-    seq += 1;
   };
 
   for (let i = 0; i < items.length; i += 1) {
     const item = items[i];
-    if (containsCue(item.text, supportCues)) {
-      const prev = i > 0 ? items[i - 1] : null;
-      const target = prev && speakerKey(prev) !== speakerKey(item) ? speakerKey(prev) : null;
+    const key = keys[i];
+    const prevKey = i > 0 ? keys[i - 1] : null;
+    const lowered = item.text.toLowerCase();
+    if (SUPPORT_CUES.test(lowered)) {
       pushEvent("support", item, {
-        target,
+        actor: key,
+        target: prevKey !== null && prevKey !== key ? prevKey : null,
         confidence: 0.72,
         rationale: "support cue detected"
       });
     }
-    if (containsCue(item.text, summaryCues)) {
+    if (SUMMARY_CUES.test(lowered)) {
       pushEvent("summary", item, {
+        actor: key,
         confidence: 0.78,
         rationale: "summary cue detected"
       });
     }
-    if (containsCue(item.text, decisionCues)) {
+    if (DECISION_CUES.test(lowered)) {
       pushEvent("decision", item, {
+        actor: key,
         confidence: 0.8,
         rationale: "decision cue detected"
       });
     }
 
-    if (i > 0) {
+    if (prevKey !== null && prevKey !== key) {
       const prev = items[i - 1];
-      if (speakerKey(prev) !== speakerKey(item)) {
-        const interruption = item.start_ms <= prev.end_ms + 300 && prev.duration_ms >= 1200;
-        if (interruption) {
-          pushEvent("interrupt", item, {
-            actor: speakerKey(item),
-            target: speakerKey(prev),
-            confidence: 0.67,
-            rationale: "rapid speaker switch near previous turn end"
-          });
-        }
+      const interruption = item.start_ms <= prev.end_ms + 300 && prev.duration_ms >= 1200;
+      if (interruption) {
+        pushEvent("interrupt", item, {
+          actor: key,
+          target: prevKey,
+          confidence: 0.67,
+          rationale: "rapid speaker switch near previous turn end"
+        });
       }
     }
   }
 
-  const totalTalkMs = params.stats.reduce((sum, item) => sum + Math.max(0, item.talk_time_ms), 0);
+  let totalTalkMs = 0;
+  for (const stat of params.stats) {
+    if (stat.talk_time_ms > 0) totalTalkMs += stat.talk_time_ms;
+  }
   if (totalTalkMs > 0) {
     for (const stat of params.stats) {
       const ratio = stat.talk_time_ms / totalTalkMs;
       if (ratio < 0.05 && stat.turns <= 2) {
         events.push({
-          event_id: `ev_${params.sessionId}_${String(seq).padStart(4, "0")}`,
+          event_id: nextEventId(),
           event_type: "silence",
           actor: stat.speaker_key,
           target: null,
@@ -170,7 +195,6 @@ export function analyzeEventsLocally(params: {
           confidence: 0.75,
           rationale: "low talk-time ratio and low turns"
         });
-        seq += 1;
       }
     }
   }
@@ -7,7 +7,7 @@ interface MemoRequestPayload {
   anchors?: unknown;
 }
 
-const ALLOWED_MEMO_TYPES: Set<MemoType> = new Set([
+export const ALLOWED_MEMO_TYPES: ReadonlySet<string> = new Set<MemoType>([
   "observation",
   "evidence",
   "question",
@@ -40,8 +40,7 @@ interface OllamaChatResponse {
  * Build the system prompt for interview feedback report synthesis.
  * Same structure as the OpenAI provider for consistency.
  */
-function buildSystemPrompt(locale: string): string {
-  const lang = locale.startsWith("zh") ? "Chinese" : "English";
+function renderSystemPrompt(lang: "Chinese" | "English"): string {
   return `You are an expert interview feedback analyst. Analyze the transcript, memos, and speaker statistics to produce a structured feedback report.
 
 Output ONLY valid JSON matching this schema (no markdown, no code blocks, no explanations):
@@ -81,6 +80,14 @@ Rules:
 - If a speaker has minimal contributions, note it but still provide feedback on visible dimensions`;
 }
 
+// Only the output language varies — render each variant once.
+const SYSTEM_PROMPT_ZH = renderSystemPrompt("Chinese");
+const SYSTEM_PROMPT_EN = renderSystemPrompt("English");
+
+function buildSystemPrompt(locale: string): string {
+  return locale.startsWith("zh") ? SYSTEM_PROMPT_ZH : SYSTEM_PROMPT_EN;
+}
+
 /**
  * Build the user message containing the session context.
  */
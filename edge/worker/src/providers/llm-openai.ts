@@ -44,8 +44,7 @@ interface OpenAIChatResponse {
  * Build the system prompt for interview feedback report synthesis.
  * Instructs the model to produce structured JSON matching the Report interface.
  */
-function buildSystemPrompt(locale: string): string {
-  const lang = locale.startsWith("zh") ? "Chinese" : "English";
+function renderSystemPrompt(lang: "Chinese" | "English"): string {
   return `You are an expert interview feedback analyst. Analyze the transcript, memos, and speaker statistics to produce a structured feedback report.
 
 Output ONLY valid JSON matching this schema (no markdown, no code blocks):
@@ -85,6 +84,15 @@ Rules:
 - If a speaker has minimal contributions, note it but still provide feedback on visible dimensions`;
 }
 
+// The prompt varies only by output language, so both variants are rendered once
+// at module load instead of rebuilding the template on every report request.
+const SYSTEM_PROMPT_ZH = renderSystemPrompt("Chinese");
+const SYSTEM_PROMPT_EN = renderSystemPrompt("English");
+
+function buildSystemPrompt(locale: string): string {
+  return locale.startsWith("zh") ? SYSTEM_PROMPT_ZH : SYSTEM_PROMPT_EN;
+}
+
 /**
  * Build the user message containing the session context.
  */
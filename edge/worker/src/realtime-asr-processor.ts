@@ -24,6 +24,7 @@ import { invokeInferenceEnroll as invokeInferenceEnrollFn } from "./inference-he
 import {
   concatUint8Arrays,
   pcm16ToWavBytes,
+  pcm16PartsToWavBytes,
   bytesToBase64,
   tailPcm16BytesToWavForSeconds,
   truncatePcm16WavToSeconds,
@@ -1812,8 +1813,7 @@ export async function maybeRunAsrWindows(
     while (nextEndSeq <= ingest.last_seq && (maxWindows <= 0 || generated < maxWindows)) {
       const startSeq = nextEndSeq - asrState.window_seconds + 1;
       const chunkRange = await loadChunkRange(sessionId, streamRole, startSeq, nextEndSeq, ctx);
-      const pcm = concatUint8Arrays(chunkRange);
-      const wavBytes = pcm16ToWavBytes(pcm);
+      const wavBytes = pcm16PartsToWavBytes(chunkRange);
       let result: { text: string; latencyMs: number };
       const asrProviderType = getAsrProvider(ctx);
       const lw = ctx.getLocalWhisperProvider();
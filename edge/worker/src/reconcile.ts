@@ -95,6 +95,11 @@ export function inferClusterFromEdgeTurns(
  * When multiple distinct speakers overlap a single ASR utterance, we create separate
  * segments for each speaker with proportionally split text.
  *
+ * Precondition: `edgeTurns` must be the output of mergeOverlappingTurns, i.e.
+ * sorted by start_ms. The scan stops at the first turn starting at or after the
+ * utterance end, so each call only walks turns up to the utterance rather than
+ * the whole session; unsorted input would silently drop later overlapping turns.
+ *
  * Returns empty array if no split is needed (single or no speaker detected).
  */
 export function splitByEdgeSpeakers(
@@ -105,6 +110,8 @@ export function splitByEdgeSpeakers(
   // Find overlapping turns, clamped to utterance boundaries
   const overlapping: Array<{ start_ms: number; end_ms: number; cluster_id: string }> = [];
   for (const turn of edgeTurns) {
+    // Sorted by start_ms (mergeOverlappingTurns): nothing later can overlap.
+    if (turn.start_ms >= endMs) break;
     const oStart = Math.max(startMs, turn.start_ms);
     const oEnd = Math.min(endMs, turn.end_ms);
     if (oEnd > oStart) {
@@ -263,7 +270,7 @@ export function resolveFromGlobalClusters(
   endMs: number,
   clusterResult: GlobalClusterResult,
   clusterRosterMapping: Map<string, string>,
-  embeddings: CachedEmbedding[]
+  embeddings: readonly CachedEmbedding[]
 ): { speaker_name: string | null; decision: "auto" | "confirm" } | null {
   // Find the embedding segment with maximum time overlap
   let bestSegmentId: string | null = null;
@@ -293,6 +300,26 @@ export function resolveFromGlobalClusters(
   return null;
 }
 
+/**
+ * Decision for a bound cluster, keyed by cluster_binding_meta.source and indexed
+ * by [meta-only binding, direct state.bindings entry]. Sources not listed fall
+ * back to DEFAULT_BOUND_DECISION; a locked binding is always "auto".
+ */
+type BoundDecisionRow = readonly ["auto" | "confirm", "auto" | "confirm"];
+const DEFAULT_BOUND_DECISION: BoundDecisionRow = ["confirm", "auto"];
+const BOUND_DECISION_BY_SOURCE: ReadonlyMap<string, BoundDecisionRow> = new Map<string, BoundDecisionRow>([
+  ["manual_map", ["auto", "auto"]],
+  ["enrollment_match", DEFAULT_BOUND_DECISION],
+  ["name_extract", ["confirm", "confirm"]],
+]);
+
+/** Decision for a speaker_map fallback by map source; other sources defer to the event decision. */
+const SPEAKER_MAP_DECISION_BY_SOURCE: ReadonlyMap<string, "auto" | "confirm"> = new Map<string, "auto" | "confirm">([
+  ["manual", "auto"],
+  ["enroll", "confirm"],
+  ["name_extract", "confirm"],
+]);
+
 /**
  * Resolve a student utterance's speaker name from binding metadata.
  * Returns the best available speaker name and confidence decision.
@@ -317,24 +344,17 @@ export function resolveStudentBinding(
   const directBinding = valueAsStr(state.bindings[clusterId]);
   const metaBinding = valueAsStr(meta?.participant_name);
   const bound = directBinding || metaBinding || null;
-  if (meta?.locked && bound) return { speaker_name: bound, decision: "auto" };
-  if (meta?.source === "manual_map" && bound) return { speaker_name: bound, decision: "auto" };
-  if (meta?.source === "enrollment_match" && bound) {
-    return { speaker_name: bound, decision: directBinding ? "auto" : "confirm" };
+  if (bound) {
+    if (meta?.locked) return { speaker_name: bound, decision: "auto" };
+    const row = BOUND_DECISION_BY_SOURCE.get(meta?.source ?? "") ?? DEFAULT_BOUND_DECISION;
+    return { speaker_name: bound, decision: row[directBinding ? 1 : 0] };
   }
-  if (meta?.source === "name_extract" && bound) return { speaker_name: bound, decision: "confirm" };
-  if (bound) return { speaker_name: bound, decision: directBinding ? "auto" : "confirm" };
 
   const mapItem = speakerMapByCluster.get(clusterId);
   const mapName = valueAsStr(mapItem?.display_name ?? mapItem?.person_id);
   if (mapName) {
-    if (mapItem?.source === "manual") {
-      return { speaker_name: mapName, decision: "auto" };
-    }
-    if (mapItem?.source === "enroll" || mapItem?.source === "name_extract") {
-      return { speaker_name: mapName, decision: "confirm" };
-    }
-    return { speaker_name: mapName, decision: eventDecision ?? "confirm" };
+    const mapDecision = SPEAKER_MAP_DECISION_BY_SOURCE.get(mapItem?.source ?? "");
+    return { speaker_name: mapName, decision: mapDecision ?? eventDecision ?? "confirm" };
   }
 
   if (eventSpeakerName) {
@@ -446,7 +466,7 @@ export function buildReconciledTranscript(options: {
   /** Mapping from global cluster IDs to roster names. */
   clusterRosterMapping?: Map<string, string> | null;
   /** Cached embeddings used for time-overlap matching. */
-  cachedEmbeddings?: CachedEmbedding[];
+  cachedEmbeddings?: readonly CachedEmbedding[];
 }): TranscriptItem[] {
   const { utterances, events, speakerLogs, state, diarizationBackend } = options;
   const roster = options.roster ?? [];
@@ -59,9 +59,19 @@ const LLM_TEMPERATURE = 0.2;
 /** Default request timeout (Python REPORT_TIMEOUT_MS default = 45000ms). */
 const DEFAULT_TIMEOUT_MS = 45_000;
 
-/** Retry policy (Python dashscope_llm.py). */
+/**
+ * Retry policy: attempt count matches Python dashscope_llm.py; the Worker also
+ * retries 408/504 and jitters its backoff (see retryDelayMs).
+ */
 const MAX_RETRIES = 2;
-const RETRYABLE_STATUS = new Set([429, 502, 503]);
+const RETRYABLE_STATUS = new Set([408, 429, 502, 503, 504]);
+
+/**
+ * Ceiling on any single retry sleep, as in the Python client. A Retry-After hint
+ * above it is not shortened (that would retry before the server is ready); the
+ * retry is skipped instead so callers' timeout budgets stay bounded.
+ */
+const MAX_RETRY_DELAY_MS = 5_000;
 
 /**
  * Generous completion cap so long multi-person reports are not truncated mid-JSON.
@@ -127,6 +137,16 @@ export interface ParsedSynthesis {
   per_person: PersonFeedbackItem[];
   summary?: string;
   personalized_memo?: string;
+  /** Claims across all per_person dimensions, tallied while parsing. */
+  claim_count: number;
+  /** Subset of claim_count with no evidence_refs. */
+  needs_evidence_count: number;
+}
+
+/** Running claim tallies threaded through the per_person parse. */
+interface ClaimCounts {
+  claims: number;
+  needsEvidence: number;
 }
 
 /** Contract envelope returned by `synthesizeReportInWorker`. */
@@ -189,7 +209,14 @@ export function truncateTranscript(
   transcript: TranscriptUtterance[],
   maxTokens: number = TRANSCRIPT_MAX_TOKENS
 ): { transcript: TranscriptUtterance[]; wasTruncated: boolean } {
-  const total = transcript.reduce((sum, u) => sum + estimateTokens(u.text), 0);
+  // Each utterance is estimated exactly once; the keep/fill passes below reuse it.
+  const costs = new Map<TranscriptUtterance, number>();
+  let total = 0;
+  for (const u of transcript) {
+    const cost = estimateTokens(u.text);
+    costs.set(u, cost);
+    total += cost;
+  }
   if (total <= maxTokens) {
     return { transcript: [...transcript], wasTruncated: false };
   }
@@ -208,13 +235,13 @@ export function truncateTranscript(
   const result: TranscriptUtterance[] = sorted.filter((u) =>
     mustKeepIds.has(u.utterance_id)
   );
-  let currentTokens = result.reduce((sum, u) => sum + estimateTokens(u.text), 0);
+  let currentTokens = result.reduce((sum, u) => sum + costs.get(u)!, 0);
 
   // Fill from the end (most recent = most relevant).
   for (let i = sorted.length - 1; i >= 0; i--) {
     const u = sorted[i];
     if (mustKeepIds.has(u.utterance_id)) continue;
-    const cost = estimateTokens(u.text);
+    const cost = costs.get(u)!;
     if (currentTokens + cost > maxTokens) continue;
     result.push(u);
     currentTokens += cost;
@@ -322,16 +349,18 @@ function extractMemoMentionedKeys(payload: SynthesizeRequestPayload): Set<string
     if (s.speaker_name) nameToKey[s.speaker_name.toLowerCase()] = s.speaker_key;
   }
 
-  // 3. Aliases → primary speaker_key.
+  // 3. Aliases → primary speaker_key. Index stats by key/name once (first stat
+  //    wins, as a front-to-back scan would) instead of rescanning per alias group.
   const nameAliases = payload.name_aliases ?? {};
-  for (const [primaryName, aliases] of Object.entries(nameAliases)) {
-    let targetKey: string | null = null;
-    for (const s of payload.stats) {
-      if (s.speaker_key === primaryName || s.speaker_name === primaryName) {
-        targetKey = s.speaker_key;
-        break;
-      }
+  const keyByPrimary = new Map<string, string>();
+  for (const s of payload.stats) {
+    if (!keyByPrimary.has(s.speaker_key)) keyByPrimary.set(s.speaker_key, s.speaker_key);
+    if (typeof s.speaker_name === "string" && !keyByPrimary.has(s.speaker_name)) {
+      keyByPrimary.set(s.speaker_name, s.speaker_key);
     }
+  }
+  for (const [primaryName, aliases] of Object.entries(nameAliases)) {
+    const targetKey = keyByPrimary.get(primaryName);
     if (targetKey) {
       for (const alias of aliases) nameToKey[alias.toLowerCase()] = targetKey;
     }
@@ -419,6 +448,48 @@ function evidenceSpeakerKey(e: EvidenceItem): string | null {
 
 // ── System prompt (Python _build_system_prompt) ─────────────────────────────
 
+// Role, scoring rubric and RULES 1-10 do not depend on the session, so they are
+// built once and lead the system message. Keeping session-specific context after
+// this block gives every report call the same prompt prefix, which DashScope's
+// implicit context cache can reuse across sessions.
+// RULES 1-10 are ported verbatim from report_synthesizer.py.
+const SYSTEM_PROMPT_STATIC_PREFIX =
+  "You are an expert interview analyst generating structured feedback reports.\n\n" +
+  `评分标准（0-10 量表）：\n` +
+  `  0-2: 严重不足 — 缺乏基本能力表现\n` +
+  `  3-4: 偏弱 — 有零星表现但整体不足\n` +
+  `  5-6: 基本达标 — 满足基本要求但无亮点\n` +
+  `  7-8: 良好 — 有明显优势和具体案例支撑\n` +
+  `  9-10: 优秀 — 表现突出，有多个强有力的证据\n\n` +
+  "RULES:\n" +
+  "1. EVIDENCE: Every claim cites 1-5 evidence_ids from evidence_pack only (no invented IDs). " +
+  "Memos/free-form notes are first-class evidence — cross-reference with transcript. " +
+  "Match evidence to speakers via speaker_key AND quote text content. " +
+  "evidence_kind='interviewer_note' 是面试官自己写的笔记/观察，绝不是候选人说过的原话——" +
+  "可作为面试官观察的依据，但严禁把它的 quote 当成候选人 transcript 引用照抄或标注为候选人发言；" +
+  "只有 evidence_kind='candidate_quote' 才是候选人真实转写。" +
+  "claim.text 必须是纯自然语言，引用放 evidence_refs 数组。优先 tier_1 证据，tier_3 仅作补充。\n" +
+  "2. CONFIDENCE: Single-evidence claims → confidence < 0.4. Weak-evidence dimensions → ONE claim at 0.3-0.4. " +
+  "binding_status='unresolved' speakers → ALL claim confidence ≤ 0.5 (code-enforced).\n" +
+  '3. SCOPE: Only evaluate INTERVIEWEES (stream_role: "students"), never the interviewer. ' +
+  "Zero-turn speakers are pre-filtered — do NOT generate entries for speakers not in interviewee_stats. " +
+  "For each person in interviewee_stats (all have turns > 0), generate ≥1 strength + ≥1 risk claim.\n" +
+  "4. DIMENSIONS: 使用 dimension_presets 评估框架，每维度独立按表现打 0-10 分。" +
+  "证据不足设 not_applicable: true + score: 5。如需额外维度，输出 suggested_dimensions。\n" +
+  "   WEIGHTING: 每个维度带一个 `weight`（默认 1，越大越重要）。0-10 的单维度分数本身绝不按 weight 缩放——" +
+  "weight 只用于形成 per_person 的整体结论（overall assessment）和候选人之间的横向排名（ranking）：" +
+  "高 weight 维度应对整体结论和排名产生更大影响，低 weight 维度影响更小。" +
+  "当所有 weight 相等（如默认全为 1）时，按等权处理，行为与未加权一致。\n" +
+  "5. ALIASES: name_aliases 中的别名是同一人，合并到 primary name 的 per_person entry（person_key = primary name）。\n" +
+  "6. CLAIMS: Each claim includes supporting_utterances (1-3 utterance_ids). " +
+  "Group observations by stage when available. Incorporate stats_observations naturally.\n" +
+  "7. OVERALL: 生成 narrative（2-4句连贯段落，围绕 position_title）+ ≥3 key_findings。" +
+  "Memo 与 transcript 矛盾时标注差异。\n" +
+  "8. RECOMMENDATION: decision (recommend/tentative/not_recommend), confidence (0-1), rationale (中文), context_type.\n" +
+  "9. QUESTION_ANALYSIS: 每个面试官问题 → question_text, answer_utterance_ids, answer_quality (A/B/C/D), comment, " +
+  "related_dimensions, scoring_rationale, answer_highlights, answer_weaknesses, suggested_better_answer。\n" +
+  "10. INTERVIEW_QUALITY: coverage_ratio (0-1), follow_up_depth (int), structure_score (0-10), suggestions (中文).\n\n";
+
 function buildSystemPrompt(payload: SynthesizeRequestPayload): string {
   const localeHint = payload.locale === "zh-CN" ? "Chinese (zh-CN)" : "English";
 
@@ -436,47 +507,7 @@ function buildSystemPrompt(payload: SynthesizeRequestPayload): string {
     `\n所有评价必须围绕候选人是否适合「${positionTitle !== "未指定" ? positionTitle : "该职位"}」展开。` +
     `不要给出泛泛的能力评估——每个 claim 都要与目标职位/项目的具体要求关联。\n\n`;
 
-  const scoringRubric =
-    `评分标准（0-10 量表）：\n` +
-    `  0-2: 严重不足 — 缺乏基本能力表现\n` +
-    `  3-4: 偏弱 — 有零星表现但整体不足\n` +
-    `  5-6: 基本达标 — 满足基本要求但无亮点\n` +
-    `  7-8: 良好 — 有明显优势和具体案例支撑\n` +
-    `  9-10: 优秀 — 表现突出，有多个强有力的证据\n\n`;
-
-  // RULES 1-10 are ported verbatim from report_synthesizer.py.
-  let prompt =
-    "You are an expert interview analyst generating structured feedback reports.\n\n" +
-    contextAnchor +
-    scoringRubric +
-    "RULES:\n" +
-    "1. EVIDENCE: Every claim cites 1-5 evidence_ids from evidence_pack only (no invented IDs). " +
-    "Memos/free-form notes are first-class evidence — cross-reference with transcript. " +
-    "Match evidence to speakers via speaker_key AND quote text content. " +
-    "evidence_kind='interviewer_note' 是面试官自己写的笔记/观察，绝不是候选人说过的原话——" +
-    "可作为面试官观察的依据，但严禁把它的 quote 当成候选人 transcript 引用照抄或标注为候选人发言；" +
-    "只有 evidence_kind='candidate_quote' 才是候选人真实转写。" +
-    "claim.text 必须是纯自然语言，引用放 evidence_refs 数组。优先 tier_1 证据，tier_3 仅作补充。\n" +
-    "2. CONFIDENCE: Single-evidence claims → confidence < 0.4. Weak-evidence dimensions → ONE claim at 0.3-0.4. " +
-    "binding_status='unresolved' speakers → ALL claim confidence ≤ 0.5 (code-enforced).\n" +
-    '3. SCOPE: Only evaluate INTERVIEWEES (stream_role: "students"), never the interviewer. ' +
-    "Zero-turn speakers are pre-filtered — do NOT generate entries for speakers not in interviewee_stats. " +
-    "For each person in interviewee_stats (all have turns > 0), generate ≥1 strength + ≥1 risk claim.\n" +
-    "4. DIMENSIONS: 使用 dimension_presets 评估框架，每维度独立按表现打 0-10 分。" +
-    "证据不足设 not_applicable: true + score: 5。如需额外维度，输出 suggested_dimensions。\n" +
-    "   WEIGHTING: 每个维度带一个 `weight`（默认 1，越大越重要）。0-10 的单维度分数本身绝不按 weight 缩放——" +
-    "weight 只用于形成 per_person 的整体结论（overall assessment）和候选人之间的横向排名（ranking）：" +
-    "高 weight 维度应对整体结论和排名产生更大影响，低 weight 维度影响更小。" +
-    "当所有 weight 相等（如默认全为 1）时，按等权处理，行为与未加权一致。\n" +
-    "5. ALIASES: name_aliases 中的别名是同一人，合并到 primary name 的 per_person entry（person_key = primary name）。\n" +
-    "6. CLAIMS: Each claim includes supporting_utterances (1-3 utterance_ids). " +
-    "Group observations by stage when available. Incorporate stats_observations naturally.\n" +
-    "7. OVERALL: 生成 narrative（2-4句连贯段落，围绕 position_title）+ ≥3 key_findings。" +
-    "Memo 与 transcript 矛盾时标注差异。\n" +
-    "8. RECOMMENDATION: decision (recommend/tentative/not_recommend), confidence (0-1), rationale (中文), context_type.\n" +
-    "9. QUESTION_ANALYSIS: 每个面试官问题 → question_text, answer_utterance_ids, answer_quality (A/B/C/D), comment, " +
-    "related_dimensions, scoring_rationale, answer_highlights, answer_weaknesses, suggested_better_answer。\n" +
-    "10. INTERVIEW_QUALITY: coverage_ratio (0-1), follow_up_depth (int), structure_score (0-10), suggestions (中文).\n\n";
+  let prompt = SYSTEM_PROMPT_STATIC_PREFIX;
 
   // NEW (Worker A5) deliverable instructions for summary / personalized_memo.
   // These fields are NOT produced by the Python service; they are gated by the
@@ -497,7 +528,9 @@ function buildSystemPrompt(payload: SynthesizeRequestPayload): string {
   }
 
   prompt +=
-    "\nOUTPUT FORMAT: Strict JSON matching the output_contract.\n" +
+    "\n" +
+    contextAnchor +
+    "OUTPUT FORMAT: Strict JSON matching the output_contract.\n" +
     `LANGUAGE: ${localeHint} — use professional, concise language.\n`;
 
   return prompt;
@@ -505,6 +538,89 @@ function buildSystemPrompt(payload: SynthesizeRequestPayload): string {
 
 // ── User prompt (Python _build_user_prompt) ─────────────────────────────────
 
+// Output contract (v2 + v3 enrichment), ported from Python. Static, so it is
+// built once at module load; buildUserPrompt copies it shallowly and appends
+// the flag-gated deliverable fields.
+const SYNTHESIS_OUTPUT_CONTRACT: Readonly<Record<string, unknown>> = {
+  overall: {
+    narrative: "string — cohesive 2-4 sentence paragraph, NO [e_XXXXX] references",
+    narrative_evidence_refs: ["e_XXXXX"],
+    key_findings: [
+      {
+        type: "strength|risk|observation",
+        text: "string — pure text, no citations",
+        evidence_refs: ["e_XXXXX"],
+      },
+    ],
+    suggested_dimensions: [
+      {
+        key: "string",
+        label_zh: "string",
+        reason: "string",
+        action: "add|replace|mark_not_applicable",
+        replaces: "string|null",
+      },
+    ],
+    recommendation: {
+      decision: "recommend / tentative / not_recommend",
+      confidence: 0.85,
+      rationale: "一句话推荐理由（中文）",
+      context_type: "hiring",
+    },
+    question_analysis: [
+      {
+        question_text: "面试官的原始问题",
+        answer_utterance_ids: ["回答的utterance id列表"],
+        answer_quality: "A/B/C/D",
+        comment: "回答质量简评（中文，1-2句）",
+        related_dimensions: ["关联的维度key"],
+        scoring_rationale: "评分理由（中文，2-3句）",
+        answer_highlights: ["亮点1：引用候选人具体表述", "亮点2"],
+        answer_weaknesses: ["不足1：具体缺陷描述", "不足2"],
+        suggested_better_answer: "改进方向建议（中文，2-3句）",
+      },
+    ],
+    interview_quality: {
+      coverage_ratio: "被有效探查的维度数/总维度数 (0-1)",
+      follow_up_depth: "面试官有效追问次数 (int)",
+      structure_score: "0-10",
+      suggestions: "对面试官的建议（中文，1-2句）",
+    },
+  },
+  per_person: [
+    {
+      person_key: "string (from stats speaker_key, interviewees only)",
+      display_name: "string",
+      dimensions: [
+        {
+          dimension: "string (from dimension_presets[].key)",
+          label_zh: "string (from dimension_presets[].label_zh)",
+          score: 8.5,
+          score_rationale: "string — 1-2 sentences",
+          evidence_insufficient: false,
+          not_applicable: false,
+          strengths: [
+            {
+              claim_id: "c_{person}_{dim}_{nn}",
+              text: "string — pure natural language, NO [e_XXXXX]",
+              evidence_refs: ["e_XXXXX"],
+              confidence: 0.85,
+              supporting_utterances: ["utterance_id"],
+            },
+          ],
+          risks: ["...same structure as strengths..."],
+          actions: ["...same structure as strengths..."],
+        },
+      ],
+      summary: {
+        strengths: ["string"],
+        risks: ["string"],
+        actions: ["string"],
+      },
+    },
+  ],
+};
+
 function buildUserPrompt(
   payload: SynthesizeRequestPayload,
   truncatedTranscript: TranscriptUtterance[]
@@ -550,14 +666,8 @@ function buildUserPrompt(
     return entry;
   });
 
-  // Speaker filtering.
-  const interviewerKeys = identifyInterviewerKeys(payload);
-  const memoMentionedKeys = extractMemoMentionedKeys(payload);
-  const { active: activeStats } = filterEligibleSpeakers(
-    payload.stats,
-    interviewerKeys,
-    memoMentionedKeys
-  );
+  // Speaker filtering — the same oracle the orchestrator uses, computed once here.
+  const { active: activeStats, interviewerKeys } = computeEligibleSpeakers(payload);
 
   // all_stats: only named speakers (avoids LLM inventing cluster-id entries).
   const allStats = payload.stats
@@ -579,86 +689,7 @@ function buildUserPrompt(
 
   const dimPresets = getDimensionPresets(payload);
 
-  // Output contract (v2 + v3 enrichment), ported from Python.
-  const outputContract: Record<string, unknown> = {
-    overall: {
-      narrative: "string — cohesive 2-4 sentence paragraph, NO [e_XXXXX] references",
-      narrative_evidence_refs: ["e_XXXXX"],
-      key_findings: [
-        {
-          type: "strength|risk|observation",
-          text: "string — pure text, no citations",
-          evidence_refs: ["e_XXXXX"],
-        },
-      ],
-      suggested_dimensions: [
-        {
-          key: "string",
-          label_zh: "string",
-          reason: "string",
-          action: "add|replace|mark_not_applicable",
-          replaces: "string|null",
-        },
-      ],
-      recommendation: {
-        decision: "recommend / tentative / not_recommend",
-        confidence: 0.85,
-        rationale: "一句话推荐理由（中文）",
-        context_type: "hiring",
-      },
-      question_analysis: [
-        {
-          question_text: "面试官的原始问题",
-          answer_utterance_ids: ["回答的utterance id列表"],
-          answer_quality: "A/B/C/D",
-          comment: "回答质量简评（中文，1-2句）",
-          related_dimensions: ["关联的维度key"],
-          scoring_rationale: "评分理由（中文，2-3句）",
-          answer_highlights: ["亮点1：引用候选人具体表述", "亮点2"],
-          answer_weaknesses: ["不足1：具体缺陷描述", "不足2"],
-          suggested_better_answer: "改进方向建议（中文，2-3句）",
-        },
-      ],
-      interview_quality: {
-        coverage_ratio: "被有效探查的维度数/总维度数 (0-1)",
-        follow_up_depth: "面试官有效追问次数 (int)",
-        structure_score: "0-10",
-        suggestions: "对面试官的建议（中文，1-2句）",
-      },
-    },
-    per_person: [
-      {
-        person_key: "string (from stats speaker_key, interviewees only)",
-        display_name: "string",
-        dimensions: [
-          {
-            dimension: "string (from dimension_presets[].key)",
-            label_zh: "string (from dimension_presets[].label_zh)",
-            score: 8.5,
-            score_rationale: "string — 1-2 sentences",
-            evidence_insufficient: false,
-            not_applicable: false,
-            strengths: [
-              {
-                claim_id: "c_{person}_{dim}_{nn}",
-                text: "string — pure natural language, NO [e_XXXXX]",
-                evidence_refs: ["e_XXXXX"],
-                confidence: 0.85,
-                supporting_utterances: ["utterance_id"],
-              },
-            ],
-            risks: ["...same structure as strengths..."],
-            actions: ["...same structure as strengths..."],
-          },
-        ],
-        summary: {
-          strengths: ["string"],
-          risks: ["string"],
-          actions: ["string"],
-        },
-      },
-    ],
-  };
+  const outputContract: Record<string, unknown> = { ...SYNTHESIS_OUTPUT_CONTRACT };
 
   // NEW deliverable fields in the output contract, gated by flags.
   const wantSummary = payload.want_summary !== false;
@@ -736,10 +767,13 @@ function buildUserPrompt(
 
 /**
  * Build the chat messages array (system + user) for the DashScope request.
- * Pure and independently testable: applies transcript truncation internally.
+ * Pure and independently testable: applies transcript truncation internally
+ * unless the caller passes an already-truncated transcript.
  */
-export function buildSynthesisMessages(payload: SynthesizeRequestPayload): ChatMessage[] {
-  const { transcript: truncated } = truncateTranscript(payload.transcript, TRANSCRIPT_MAX_TOKENS);
+export function buildSynthesisMessages(
+  payload: SynthesizeRequestPayload,
+  truncated: TranscriptUtterance[] = truncateTranscript(payload.transcript, TRANSCRIPT_MAX_TOKENS).transcript
+): ChatMessage[] {
   return [
     { role: "system", content: buildSystemPrompt(payload) },
     { role: "user", content: buildUserPrompt(payload, truncated) },
@@ -809,9 +843,19 @@ function toFloat(v: unknown, fallback: number): number {
   return Number.isFinite(n) ? n : fallback;
 }
 
-function asStringArray(v: unknown): string[] {
+/**
+ * Trimmed non-empty strings from `v`, in one pass. Stops once `limit` items are
+ * collected so capped fields (evidence refs, bullets) skip the rest of a long list.
+ */
+function asStringArray(v: unknown, limit = Infinity): string[] {
   if (!Array.isArray(v)) return [];
-  return v.map((x) => asString(x).trim()).filter((s) => s.length > 0);
+  const out: string[] = [];
+  for (const x of v) {
+    if (out.length >= limit) break;
+    const s = asString(x).trim();
+    if (s) out.push(s);
+  }
+  return out;
 }
 
 // ── Response parsing (Python _parse_llm_output) ─────────────────────────────
@@ -835,15 +879,23 @@ export function parseSynthesisResponse(raw: string): ParsedSynthesis {
   const empty: ParsedSynthesis = {
     overall: { narrative: "", narrative_evidence_refs: [], key_findings: [] },
     per_person: [],
+    claim_count: 0,
+    needs_evidence_count: 0,
   };
 
   const parsed = extractJsonObject(raw);
   if (!parsed) return empty;
 
   const overall = parseOverall(parsed.overall);
-  const perPerson = parsePerPerson(parsed.per_person);
-
-  const result: ParsedSynthesis = { overall, per_person: perPerson };
+  const counts: ClaimCounts = { claims: 0, needsEvidence: 0 };
+  const perPerson = parsePerPerson(parsed.per_person, counts);
+
+  const result: ParsedSynthesis = {
+    overall,
+    per_person: perPerson,
+    claim_count: counts.claims,
+    needs_evidence_count: counts.needsEvidence,
+  };
 
   const summary = asString(parsed.summary).trim();
   if (summary) result.summary = summary;
@@ -874,7 +926,7 @@ function parseOverall(raw: unknown): OverallFeedback {
       keyFindings.push({
         type: type as "strength" | "risk" | "observation",
         text,
-        evidence_refs: asStringArray(k.evidence_refs).slice(0, 5),
+        evidence_refs: asStringArray(k.evidence_refs, 5),
       });
     }
   }
@@ -910,8 +962,8 @@ function parseOverall(raw: unknown): OverallFeedback {
       if (!topic) continue;
       summarySections.push({
         topic,
-        bullets: asStringArray(s.bullets).slice(0, 6),
-        evidence_ids: asStringArray(s.evidence_ids).slice(0, 6),
+        bullets: asStringArray(s.bullets, 6),
+        evidence_ids: asStringArray(s.evidence_ids, 6),
       });
     }
   }
@@ -919,8 +971,8 @@ function parseOverall(raw: unknown): OverallFeedback {
   const teamRaw = o.team_dynamics && typeof o.team_dynamics === "object"
     ? (o.team_dynamics as Record<string, unknown>)
     : {};
-  const highlights = asStringArray(teamRaw.highlights).slice(0, 6);
-  const risks = asStringArray(teamRaw.risks).slice(0, 6);
+  const highlights = asStringArray(teamRaw.highlights, 6);
+  const risks = asStringArray(teamRaw.risks, 6);
 
   // Fallback: derive narrative from legacy summary_sections if missing.
   let finalNarrative = narrative;
@@ -947,7 +999,12 @@ function parseOverall(raw: unknown): OverallFeedback {
   };
 }
 
-function parseClaims(raw: unknown, personKey: string, dimName: string): DimensionClaim[] {
+function parseClaims(
+  raw: unknown,
+  personKey: string,
+  dimName: string,
+  counts: ClaimCounts
+): DimensionClaim[] {
   if (!Array.isArray(raw)) return [];
   const claims: DimensionClaim[] = [];
   for (const c of raw) {
@@ -956,9 +1013,11 @@ function parseClaims(raw: unknown, personKey: string, dimName: string): Dimensio
     const text = asString(obj.text).trim();
     if (!text) continue;
     const cid = asString(obj.claim_id).trim();
-    const refs = asStringArray(obj.evidence_refs).slice(0, 5);
+    const refs = asStringArray(obj.evidence_refs, 5);
     const conf = clamp(toFloat(obj.confidence, 0.7), 0, 1);
-    const supporting = asStringArray(obj.supporting_utterances).slice(0, 3);
+    const supporting = asStringArray(obj.supporting_utterances, 3);
+    counts.claims += 1;
+    if (refs.length === 0) counts.needsEvidence += 1;
     claims.push({
       // Auto-generate a stable id when the LLM omitted one (1-based, 2-digit).
       claim_id:
@@ -973,7 +1032,7 @@ function parseClaims(raw: unknown, personKey: string, dimName: string): Dimensio
   return claims;
 }
 
-function parsePerPerson(raw: unknown): PersonFeedbackItem[] {
+function parsePerPerson(raw: unknown, counts: ClaimCounts): PersonFeedbackItem[] {
   if (!Array.isArray(raw)) return [];
   const out: PersonFeedbackItem[] = [];
 
@@ -998,9 +1057,9 @@ function parsePerPerson(raw: unknown): PersonFeedbackItem[] {
           score_rationale: asString(d.score_rationale).trim(),
           evidence_insufficient: Boolean(d.evidence_insufficient),
           not_applicable: Boolean(d.not_applicable),
-          strengths: parseClaims(d.strengths, personKey, dimName),
-          risks: parseClaims(d.risks, personKey, dimName),
-          actions: parseClaims(d.actions, personKey, dimName),
+          strengths: parseClaims(d.strengths, personKey, dimName, counts),
+          risks: parseClaims(d.risks, personKey, dimName, counts),
+          actions: parseClaims(d.actions, personKey, dimName, counts),
         });
       }
     }
@@ -1014,9 +1073,9 @@ function parsePerPerson(raw: unknown): PersonFeedbackItem[] {
       display_name: displayName,
       dimensions,
       summary: {
-        strengths: asStringArray(summaryRaw.strengths).slice(0, 3),
-        risks: asStringArray(summaryRaw.risks).slice(0, 3),
-        actions: asStringArray(summaryRaw.actions).slice(0, 3),
+        strengths: asStringArray(summaryRaw.strengths, 3),
+        risks: asStringArray(summaryRaw.risks, 3),
+        actions: asStringArray(summaryRaw.actions, 3),
       },
     });
   }
@@ -1036,10 +1095,43 @@ function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+/**
+ * Exponential backoff scaled by a random factor in [0.5, 1.5), so concurrent
+ * sessions hitting the same 429 burst do not retry in lockstep. Never above
+ * MAX_RETRY_DELAY_MS.
+ */
+function backoffDelayMs(attempt: number): number {
+  const base = Math.min(2 ** attempt * 500, MAX_RETRY_DELAY_MS);
+  return Math.min(base * (0.5 + Math.random()), MAX_RETRY_DELAY_MS);
+}
+
+/**
+ * Delay before retrying a retryable status. A Retry-After hint (delta-seconds) is
+ * only jittered upward, so we never retry before the server asked; returns null
+ * when the hint exceeds MAX_RETRY_DELAY_MS and the retry should be skipped.
+ */
+function retryDelayMs(attempt: number, retryAfter: string | null): number | null {
+  const hint = retryAfter?.trim();
+  if (!hint || !/^\d+$/.test(hint)) return backoffDelayMs(attempt);
+  const hintMs = Number(hint) * 1000;
+  if (hintMs > MAX_RETRY_DELAY_MS) return null;
+  return Math.min(hintMs + Math.random() * 500, MAX_RETRY_DELAY_MS);
+}
+
+/** Cancel an unconsumed response body; failures here are irrelevant to the caller. */
+async function discardBody(response: Response): Promise<void> {
+  try {
+    await response.body?.cancel();
+  } catch {
+    // Body already consumed or stream errored — nothing to release.
+  }
+}
+
 /**
  * Call DashScope chat-completions and return the raw assistant message content.
- * Retries on timeout (AbortError) and retryable status codes (429/502/503),
- * with exponential backoff capped at 5s — matching the Python client.
+ * Retries on timeout (AbortError) and retryable status codes (408/429/502/503/504)
+ * with jittered exponential backoff capped at 5s. A Retry-After hint is honored when
+ * it fits under that cap; a longer hint fails fast instead of blocking the caller.
  */
 async function callDashScope(
   apiKey: string,
@@ -1089,7 +1181,7 @@ async function callDashScope(
       clearTimeout(timer);
       // Timeout / network abort → retry, else fail.
       if (attempt < maxRetries) {
-        await sleep(Math.min(2 ** attempt * 500, 5000));
+        await sleep(backoffDelayMs(attempt));
         continue;
       }
       throw new SynthesizerError("Report generation service timed out after retries");
@@ -1111,10 +1203,17 @@ async function callDashScope(
       return content;
     }
 
-    // Retryable status → backoff + retry.
+    // Error bodies are never read; release them so the runtime can reuse the
+    // connection to DashScope for the next attempt instead of holding it open.
+    await discardBody(response);
+
+    // Retryable status → backoff + retry (unless Retry-After asks for longer than we wait).
     if (RETRYABLE_STATUS.has(response.status) && attempt < maxRetries) {
-      await sleep(Math.min(2 ** attempt * 500, 5000));
-      continue;
+      const delayMs = retryDelayMs(attempt, response.headers.get("Retry-After"));
+      if (delayMs !== null) {
+        await sleep(delayMs);
+        continue;
+      }
     }
 
     // Non-retryable or exhausted retries.
@@ -1155,9 +1254,9 @@ export async function synthesizeReportInWorker(
   const model = (env as Env & { LLM_MODEL?: string }).LLM_MODEL ?? DEFAULT_LLM_MODEL;
   const timeoutMs = parseTimeoutMs(env.INFERENCE_TIMEOUT_MS);
 
-  // Build prompt (also tells us whether the transcript was truncated, for quality meta).
-  const { wasTruncated } = truncateTranscript(payload.transcript, TRANSCRIPT_MAX_TOKENS);
-  const messages = buildSynthesisMessages(payload);
+  // Truncate once: the result feeds both the prompt and the quality meta.
+  const { transcript: truncated, wasTruncated } = truncateTranscript(payload.transcript, TRANSCRIPT_MAX_TOKENS);
+  const messages = buildSynthesisMessages(payload, truncated);
 
   // Call the LLM (may throw SynthesizerError — caller handles fallback).
   const rawContent = await callDashScope(apiKey, model, messages, timeoutMs);
@@ -1170,24 +1269,13 @@ export async function synthesizeReportInWorker(
     warnings.push("llm_synthesis_no_per_person");
   }
 
-  // Count claims for quality meta.
-  let claimCount = 0;
-  let needsEvidence = 0;
-  for (const person of parsed.per_person) {
-    for (const dim of person.dimensions) {
-      for (const claim of [...dim.strengths, ...dim.risks, ...dim.actions]) {
-        claimCount += 1;
-        if (!claim.evidence_refs || claim.evidence_refs.length === 0) needsEvidence += 1;
-      }
-    }
-  }
-
   const quality: Partial<ReportQualityMeta> = {
     report_source: wasTruncated ? "llm_synthesized_truncated" : "llm_synthesized",
     report_model: model,
     report_error: null,
-    claim_count: claimCount,
-    needs_evidence_count: needsEvidence,
+    // Tallied during parsing — no second walk over every claim.
+    claim_count: parsed.claim_count,
+    needs_evidence_count: parsed.needs_evidence_count,
   };
 
   const wantSummary = payload.want_summary !== false;
@@ -1281,8 +1369,5 @@ export async function synthesizeDegradedOverviewSummary(
     maxTokens: DEGRADED_SUMMARY_MAX_TOKENS,
   });
   const parsed = extractJsonObject(raw);
-  return asStringArray(parsed?.["bullets"])
-    .map((bullet) => bullet.trim())
-    .filter((bullet) => bullet.length > 0)
-    .slice(0, DEGRADED_SUMMARY_MAX_BULLETS);
+  return asStringArray(parsed?.["bullets"], DEGRADED_SUMMARY_MAX_BULLETS);
 }
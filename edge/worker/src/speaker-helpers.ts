@@ -17,6 +17,16 @@ import type {
 } from "./config";
 import { valueAsString, extractNameFromText } from "./config";
 
+/** cluster_binding_meta.source → speaker_map source; unlisted sources fall through. */
+const SPEAKER_MAP_SOURCE_BY_BINDING: ReadonlyMap<string, NonNullable<SpeakerMapItem["source"]>> = new Map<
+  string,
+  NonNullable<SpeakerMapItem["source"]>
+>([
+  ["manual_map", "manual"],
+  ["enrollment_match", "enroll"],
+  ["name_extract", "name_extract"],
+]);
+
 // ── Teacher identity resolution ─────────────────────────────────────
 
 export function resolveTeacherIdentity(
@@ -110,14 +120,7 @@ export function deriveSpeakerLogsFromTranscript(
     const meta = state.cluster_binding_meta[clusterId];
     const metaName = valueAsString(meta?.participant_name);
     const bound = state.bindings[clusterId] ?? (metaName || null);
-    const mapSource: "manual" | "enroll" | "name_extract" | "unknown" =
-      meta?.source === "manual_map"
-        ? "manual"
-        : meta?.source === "enrollment_match"
-          ? "enroll"
-          : meta?.source === "name_extract"
-            ? "name_extract"
-            : "unknown";
+    const mapSource = SPEAKER_MAP_SOURCE_BY_BINDING.get(meta?.source ?? "") ?? "unknown";
     return {
       cluster_id: clusterId,
       person_id: bound,
@@ -162,14 +165,9 @@ export function buildEdgeSpeakerLogsForFinalize(
     const metaName = valueAsString(meta?.participant_name);
     const mapName = valueAsString(mapByCluster.get(clusterId)?.display_name ?? mapByCluster.get(clusterId)?.person_id);
     const bound = state.bindings[clusterId] ?? (metaName || mapName || null);
-    const source: "manual" | "enroll" | "name_extract" | "unknown" =
-      meta?.source === "manual_map"
-        ? "manual"
-        : meta?.source === "enrollment_match"
-          ? "enroll"
-          : meta?.source === "name_extract"
-            ? "name_extract"
-            : (mapByCluster.get(clusterId)?.source ?? "unknown");
+    const source = SPEAKER_MAP_SOURCE_BY_BINDING.get(meta?.source ?? "")
+      ?? mapByCluster.get(clusterId)?.source
+      ?? "unknown";
     mapByCluster.set(clusterId, {
       cluster_id: clusterId,
       person_id: bound,
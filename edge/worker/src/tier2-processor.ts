@@ -22,7 +22,7 @@ import {
   generateStatsObservations,
 } from "./finalize_v2";
 import type { TranscriptItem } from "./finalize_v2";
-import { concatUint8Arrays, pcm16ToWavBytes, bytesToBase64, TARGET_SAMPLE_RATE, TARGET_CHANNELS } from "./audio-utils";
+import { pcm16PartsToWavBytes, bytesToBase64, TARGET_SAMPLE_RATE, TARGET_CHANNELS } from "./audio-utils";
 import { persistSessionToD1 } from "./d1-helpers";
 import type {
   Tier2Status,
@@ -165,8 +165,7 @@ export async function runTier2Job(sessionId: string, ctx: Tier2Context): Promise
         pcmParts.push(new Uint8Array(await obj.arrayBuffer()));
       }
     }
-    const fullPcm = concatUint8Arrays(pcmParts);
-    const wavBytes = pcm16ToWavBytes(fullPcm, TARGET_SAMPLE_RATE, TARGET_CHANNELS);
+    const wavBytes = pcm16PartsToWavBytes(pcmParts, TARGET_SAMPLE_RATE, TARGET_CHANNELS);
 
     await updateTier2Status({
       status: "transcribing",
@@ -4,6 +4,7 @@ import {
   bytesToBase64,
   concatUint8Arrays,
   pcm16ToWavBytes,
+  pcm16PartsToWavBytes,
   truncatePcm16WavToSeconds,
   tailPcm16BytesToWavForSeconds,
   encodeUtf8,
@@ -130,6 +131,21 @@ describe("pcm16ToWavBytes", () => {
   });
 });
 
+/* ── pcm16PartsToWavBytes ─────────────────────── */
+
+describe("pcm16PartsToWavBytes", () => {
+  it("matches concatenating the parts then wrapping them", () => {
+    const parts = [new Uint8Array([1, 2, 3, 4]), new Uint8Array(0), new Uint8Array([5, 6])];
+    expect(pcm16PartsToWavBytes(parts)).toEqual(pcm16ToWavBytes(concatUint8Arrays(parts)));
+  });
+
+  it("produces a bare header for no parts", () => {
+    const wav = pcm16PartsToWavBytes([]);
+    expect(wav.length).toBe(44);
+    expect(new DataView(wav.buffer).getUint32(40, true)).toBe(0);
+  });
+});
+
 /* ── truncatePcm16WavToSeconds ────────────────── */
 
 describe("truncatePcm16WavToSeconds", () => {
@@ -1,6 +1,9 @@
 import { describe, it, expect } from "vitest";
 import {
   cosineSimilarity,
+  l2Normalize,
+  dotProduct,
+  packUnitRows,
   computeDistanceMatrix,
   agglomerativeClustering,
   globalCluster,
@@ -152,6 +155,25 @@ describe("cosineSimilarity", () => {
 
 // ── computeDistanceMatrix ────────────────────────────────────────────────────
 
+describe("l2Normalize / dotProduct", () => {
+  it("produces unit vectors whose dot product equals cosine similarity", () => {
+    const a = new Float32Array([3, 4, 0]);
+    const b = new Float32Array([1, 2, 2]);
+    const ua = l2Normalize(a);
+    expect(dotProduct(ua, ua)).toBeCloseTo(1, 5);
+    expect(dotProduct(ua, l2Normalize(b))).toBeCloseTo(cosineSimilarity(a, b), 5);
+  });
+
+  it("leaves zero vectors at zero", () => {
+    expect([...l2Normalize(new Float32Array(3))]).toEqual([0, 0, 0]);
+  });
+
+  it("returns 0 for empty or mismatched vectors", () => {
+    expect(dotProduct(new Float32Array(0), new Float32Array(0))).toBe(0);
+    expect(dotProduct(new Float32Array([1]), new Float32Array([1, 0]))).toBe(0);
+  });
+});
+
 describe("computeDistanceMatrix", () => {
   it("returns empty for no embeddings", () => {
     const dist = computeDistanceMatrix([]);
@@ -190,6 +212,35 @@ describe("computeDistanceMatrix", () => {
       }
     }
   });
+
+  it("matches 1 - cosine similarity", () => {
+    const vecs = [
+      new Float32Array([1, 2, 3]),
+      new Float32Array([-4, 5, 0]),
+      new Float32Array([0, 0, 0]),
+    ];
+    const dist = computeDistanceMatrix(vecs);
+    expect(dist[1]).toBeCloseTo(1 - cosineSimilarity(vecs[0], vecs[1]), 5);
+    expect(dist[2]).toBeCloseTo(1, 5); // zero vector has similarity 0
+  });
+
+  it("treats mismatched dimensions as unrelated", () => {
+    const dist = computeDistanceMatrix([new Float32Array([1, 0]), new Float32Array([1, 0, 0])]);
+    expect(dist[1]).toBeCloseTo(1, 5);
+  });
+});
+
+describe("packUnitRows", () => {
+  it("packs normalized rows contiguously", () => {
+    const packed = packUnitRows([new Float32Array([3, 4]), new Float32Array([0, 2])]);
+    expect(packed?.dim).toBe(2);
+    expect([...packed!.rows].map((v) => Number(v.toFixed(5)))).toEqual([0.6, 0.8, 0, 1]);
+  });
+
+  it("returns null for empty input or mixed dimensions", () => {
+    expect(packUnitRows([])).toBeNull();
+    expect(packUnitRows([new Float32Array([1]), new Float32Array([1, 2])])).toBeNull();
+  });
 });
 
 // ── agglomerativeClustering ──────────────────────────────────────────────────
@@ -404,6 +455,15 @@ describe("mapClustersToRoster", () => {
     expect(aliceCount).toBeLessThanOrEqual(1);
   });
 
+  it("scores unnormalized enrollment embeddings like cosine similarity", () => {
+    const entries = [makeEntry("seg_001", 1, 0)];
+    const clusterResult = globalCluster(entries, { distance_threshold: 0.3 });
+    const scaled = makeSpeakerEmbedding(1).map((v) => v * 7.5);
+    const roster: RosterParticipant[] = [{ name: "Alice", enrollment_embedding: scaled }];
+    const mapping = mapClustersToRoster(clusterResult, roster, 0.9);
+    expect(mapping.get("spk_0")).toBe("Alice");
+  });
+
   it("respects similarity threshold", () => {
     const entries = [makeEntry("seg_001", 1, 0)];
     const clusterResult = globalCluster(entries, { distance_threshold: 0.3 });
@@ -272,6 +272,19 @@ describe("buildSynthesisMessages", () => {
     const msgs = buildSynthesisMessages(payload());
     expect(msgs[0].content).toContain("SUMMARY");
   });
+
+  it("keeps session context after the shared rules so the prompt prefix is stable", () => {
+    const a = buildSynthesisMessages(
+      payload({ session_context: { mode: "1v1", position_title: "Backend Engineer", stage_descriptions: [] } })
+    )[0].content;
+    const b = buildSynthesisMessages(
+      payload({ session_context: { mode: "1v1", position_title: "Data Scientist", stage_descriptions: [] } })
+    )[0].content;
+    const rulesEnd = a.indexOf("10. INTERVIEW_QUALITY");
+    expect(rulesEnd).toBeGreaterThan(0);
+    expect(b.slice(0, rulesEnd)).toBe(a.slice(0, rulesEnd));
+    expect(a.indexOf("Backend Engineer")).toBeGreaterThan(rulesEnd);
+  });
 });
 
 // ── parseSynthesisResponse: well-formed ──────────────────────────────────────
@@ -366,6 +379,27 @@ describe("parseSynthesisResponse (well-formed)", () => {
     expect(result.per_person).toHaveLength(1);
     expect(result.overall.narrative).toContain("strong leadership");
   });
+
+  it("tallies claims and evidence-less claims while parsing", () => {
+    const raw = {
+      per_person: [
+        {
+          person_key: "Alice",
+          dimensions: [
+            {
+              dimension: "logic",
+              strengths: [{ text: "cited", evidence_refs: ["e_1"] }, { text: "uncited" }],
+              risks: [{ text: "" }], // empty text → dropped, not counted
+              actions: [{ text: "also uncited", evidence_refs: [] }],
+            },
+          ],
+        },
+      ],
+    };
+    const result = parseSynthesisResponse(JSON.stringify(raw));
+    expect(result.claim_count).toBe(3);
+    expect(result.needs_evidence_count).toBe(2);
+  });
 });
 
 // ── parseSynthesisResponse: malformed / empty (safe defaults, no throw) ───────
@@ -374,6 +408,7 @@ describe("parseSynthesisResponse (malformed / empty)", () => {
   it("returns safe empty defaults for empty input", () => {
     const result = parseSynthesisResponse("");
     expect(result.per_person).toEqual([]);
+    expect(result.claim_count).toBe(0);
     expect(result.overall.narrative).toBe("");
     expect(result.overall.key_findings).toEqual([]);
     expect(result.summary).toBeUndefined();
@@ -446,6 +481,7 @@ describe("synthesizeReportInWorker (fetch stubbed)", () => {
   function stubFetchOnce(content: string, status = 200) {
     const fetchMock = vi.fn(async () => ({
       status,
+      headers: new Headers(),
       json: async () => ({ choices: [{ message: { content } }] }),
     }));
     vi.stubGlobal("fetch", fetchMock);
@@ -468,6 +504,34 @@ describe("synthesizeReportInWorker (fetch stubbed)", () => {
     expect(result.data.quality?.claim_count).toBe(1);
   });
 
+  it("retries retryable statuses (incl. 504) honoring Retry-After", async () => {
+    const ok = {
+      status: 200,
+      headers: new Headers(),
+      json: async () => ({ choices: [{ message: { content: JSON.stringify(WELL_FORMED) } }] }),
+    };
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce({ status: 429, headers: new Headers({ "Retry-After": "0" }) })
+      .mockResolvedValueOnce({ status: 504, headers: new Headers({ "Retry-After": "0" }) })
+      .mockResolvedValueOnce(ok);
+    vi.stubGlobal("fetch", fetchMock);
+
+    const result = await synthesizeReportInWorker(env(), payload());
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+    expect(result.data.per_person).toHaveLength(1);
+  });
+
+  it("fails fast instead of sleeping when Retry-After exceeds the retry ceiling", async () => {
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce({ status: 429, headers: new Headers({ "Retry-After": "60" }) });
+    vi.stubGlobal("fetch", fetchMock);
+
+    await expect(synthesizeReportInWorker(env(), payload())).rejects.toThrow(/status=429/);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
   it("marks degraded=true when the LLM yields no per_person", async () => {
     stubFetchOnce(JSON.stringify({ overall: { narrative: "n", key_findings: [] }, per_person: [] }));
     const result = await synthesizeReportInWorker(env(), payload());
@@ -498,6 +562,7 @@ describe("synthesizeDegradedOverviewSummary (fetch stubbed)", () => {
   function stubFetchOnce(content: string, status = 200) {
     const fetchMock = vi.fn(async () => ({
       status,
+      headers: new Headers(),
       json: async () => ({ choices: [{ message: { content } }] }),
     }));
     vi.stubGlobal("fetch", fetchMock);
@@ -0,0 +1,39 @@
+import { describe, it, expect } from "vitest";
+import { analyzeEventsLocally } from "../src/local_events_analyzer";
+
+function utt(id: string, speaker: string, text: string, startMs: number) {
+  return {
+    utterance_id: id,
+    stream_role: "students" as const,
+    speaker_name: speaker,
+    text,
+    start_ms: startMs,
+    end_ms: startMs + 1000,
+    duration_ms: 1000,
+  };
+}
+
+describe("analyzeEventsLocally: cue detection", () => {
+  it("flags support / summary / decision cues case-insensitively, once per category", () => {
+    const events = analyzeEventsLocally({
+      sessionId: "s1",
+      stats: [],
+      memos: [],
+      transcript: [
+        utt("u1", "Alice", "We should ship the MVP first.", 0),
+        utt("u2", "Bob", "I AGREE, and building on that point…", 5_000),
+        utt("u3", "Alice", "总结一下：下一步是定结论。", 10_000),
+        utt("u4", "Bob", "The price is $5 (or less).", 15_000),
+      ],
+    });
+    const byUtt = (id: string) =>
+      events.filter((e) => e.utterance_ids[0] === id).map((e) => e.event_type);
+
+    expect(byUtt("u1")).toEqual([]);
+    expect(byUtt("u2")).toEqual(["support"]);
+    expect(events.find((e) => e.event_type === "support")?.target).toBe("Alice");
+    expect(byUtt("u3")).toEqual(["summary", "decision"]);
+    // Regex metacharacters in the text are matched literally, never as cues.
+    expect(byUtt("u4")).toEqual([]);
+  });
+});
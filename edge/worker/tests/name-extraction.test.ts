@@ -0,0 +1,28 @@
+import { describe, it, expect } from "vitest";
+import { extractNameFromText } from "../src/config";
+
+describe("extractNameFromText", () => {
+  it("extracts a self-introduced name", () => {
+    expect(extractNameFromText("Hi everyone, my name is Tina Chen.")).toBe("Tina Chen");
+    expect(extractNameFromText("You can call me Bob")).toBe("Bob");
+  });
+
+  it("prefers an explicit 'my name is' over an earlier 'i am'", () => {
+    expect(extractNameFromText("I am Alice, well my name is Alicia")).toBe("Alicia");
+  });
+
+  it("falls through to the next pattern when a candidate is rejected", () => {
+    // "really excited" hits the stopword list, so "i'm" is tried next.
+    expect(extractNameFromText("I am really excited, I'm Jordan")).toBe("Jordan");
+  });
+
+  it("returns null when no introduction is present", () => {
+    expect(extractNameFromText("The system scales horizontally.")).toBeNull();
+    expect(extractNameFromText("")).toBeNull();
+  });
+
+  it("still matches mixed-case and 'goes by' introductions past the literal prefilter", () => {
+    expect(extractNameFromText("MY NAME IS Sam")).toBe("Sam");
+    expect(extractNameFromText("Everyone usually goes by Alex")).toBe("Alex");
+  });
+});
@@ -1,6 +1,7 @@
 import { describe, it, expect } from "vitest";
 import {
   inferClusterFromEdgeTurns,
+  splitByEdgeSpeakers,
   resolveStudentBinding,
   resolveFromGlobalClusters,
   prepareEdgeTurns,
@@ -58,6 +59,43 @@ describe("inferClusterFromEdgeTurns", () => {
   });
 });
 
+/* ── splitByEdgeSpeakers ──────────────────────── */
+
+describe("splitByEdgeSpeakers", () => {
+  const turns = [
+    { start_ms: 0, end_ms: 2000, cluster_id: "Alice" },
+    { start_ms: 2000, end_ms: 4000, cluster_id: "Bob" },
+    { start_ms: 4000, end_ms: 8000, cluster_id: "Alice" },
+    { start_ms: 9000, end_ms: 12000, cluster_id: "Bob" },
+  ];
+
+  it("splits an utterance at speaker boundaries with time fractions", () => {
+    expect(splitByEdgeSpeakers(1000, 5000, turns)).toEqual([
+      { start_ms: 1000, end_ms: 2000, cluster_id: "Alice", fraction: 0.25 },
+      { start_ms: 2000, end_ms: 4000, cluster_id: "Bob", fraction: 0.5 },
+      { start_ms: 4000, end_ms: 5000, cluster_id: "Alice", fraction: 0.25 },
+    ]);
+  });
+
+  it("returns no split when only one speaker overlaps the utterance", () => {
+    // Only Alice's [4000..8000] overlaps; Bob's turn starts at the utterance end.
+    expect(splitByEdgeSpeakers(5000, 9000, turns)).toEqual([]);
+  });
+
+  it("stops scanning at the first turn starting at or after the utterance end", () => {
+    // A trailing turn whose end_ms is unreadable: only the early exit (which checks
+    // start_ms first) keeps the scan from touching it.
+    const trailing = {
+      start_ms: 20_000,
+      cluster_id: "Carol",
+      get end_ms(): number {
+        throw new Error("scanned past the utterance end");
+      },
+    };
+    expect(splitByEdgeSpeakers(1000, 5000, [...turns, trailing])).toHaveLength(3);
+  });
+});
+
 /* ── resolveStudentBinding ────────────────────── */
 
 describe("resolveStudentBinding", () => {
@@ -142,6 +180,26 @@ describe("resolveStudentBinding", () => {
       const result = resolveStudentBinding(state, "c_01", null, null);
       expect(result).toEqual({ speaker_name: "Alice", decision: "confirm" });
     });
+
+    it("keeps name_extract at confirm even with a direct binding", () => {
+      const state: ReconcileSessionState = {
+        bindings: { c_01: "Alice" },
+        cluster_binding_meta: {
+          c_01: { participant_name: "Alice", source: "name_extract" },
+        },
+      };
+      const result = resolveStudentBinding(state, "c_01", null, null);
+      expect(result).toEqual({ speaker_name: "Alice", decision: "confirm" });
+    });
+
+    it("uses direct binding for unlisted sources", () => {
+      const state: ReconcileSessionState = {
+        bindings: { c_01: "Alice" },
+        cluster_binding_meta: { c_01: { source: "inference_resolve" } },
+      };
+      const result = resolveStudentBinding(state, "c_01", null, null);
+      expect(result).toEqual({ speaker_name: "Alice", decision: "auto" });
+    });
   });
 
   describe("with speaker map fallback", () => {